@@ -1,15 +1,259 @@
+import bisect
 import json
+import operator
 import re
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import MappingProxyType
 import logging
 
+import numpy as np
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+class BudgetHealth(IntEnum):
+    """Budget health tiers, ordered worst to best.
+
+    Integer-valued so comparisons are single CMPs and the tier can be
+    stored in compact numeric columns.
+    """
+    NEEDS_IMPROVEMENT = 0
+    FAIR = 1
+    GOOD = 2
+    EXCELLENT = 3
+
+
+# Savings-rate cut-offs for the health tiers; bisect_right keeps the
+# original ">= threshold" semantics (a rate of exactly 20 is EXCELLENT).
+_HEALTH_THRESH = (5, 10, 20)
+_HEALTH_LABELS = (BudgetHealth.NEEDS_IMPROVEMENT, BudgetHealth.FAIR,
+                  BudgetHealth.GOOD, BudgetHealth.EXCELLENT)
+
+
+def _tax_kernel_py(income, lowers, uppers, rates):
+    """Scalar tax-bracket kernel: total tax owed on a single income."""
+    total = 0.0
+    for i in range(lowers.shape[0]):
+        taxable = min(income, uppers[i]) - lowers[i]
+        if taxable <= 0:
+            break
+        total += taxable * rates[i]
+    return total
+
+
+def _tax_kernel_batch_py(incomes, lowers, uppers, rates):
+    """Batch tax kernel: total tax for each income in the input array."""
+    out = np.empty_like(incomes)
+    for j in range(incomes.shape[0]):
+        out[j] = _tax_kernel_py(incomes[j], lowers, uppers, rates)
+    return out
+
+
+# Numba is imported lazily: pulling it in (even with a warm disk cache)
+# costs hundreds of milliseconds, which would land on module import and
+# make cold starts user-visible. The first tax calculation compiles the
+# kernels instead; processes that never price taxes never pay for numba.
+# The compiled scalar kernel turns the bracket loop into machine code;
+# the batch kernel additionally releases the GIL and spreads the incomes
+# across cores with prange.
+_COMPILED_KERNELS = None
+
+
+def _get_kernels():
+    """Return (scalar, batch) kernels, compiling them on first use."""
+    global _COMPILED_KERNELS
+    if _COMPILED_KERNELS is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _COMPILED_KERNELS = (_tax_kernel_py, _tax_kernel_batch_py)
+        else:
+            @njit(parallel=True, nogil=True, cache=True, fastmath=True)
+            def batch_kernel(incomes, lowers, uppers, rates):
+                out = np.empty_like(incomes)
+                for j in prange(incomes.shape[0]):
+                    total = 0.0
+                    for i in range(lowers.shape[0]):
+                        taxable = min(incomes[j], uppers[i]) - lowers[i]
+                        if taxable <= 0:
+                            break
+                        total += taxable * rates[i]
+                    out[j] = total
+                return out
+
+            _COMPILED_KERNELS = (njit(cache=True, fastmath=True)(_tax_kernel_py), batch_kernel)
+    return _COMPILED_KERNELS
+
+
+def _tax_kernel(income, lowers, uppers, rates):
+    return _get_kernels()[0](income, lowers, uppers, rates)
+
+
+def _tax_kernel_batch(incomes, lowers, uppers, rates):
+    return _get_kernels()[1](incomes, lowers, uppers, rates)
+
+# Response templates, parsed once at import. Handlers fill them in with
+# str.format_map instead of rebuilding multi-line f-strings on every call.
+_BUDGET_TMPL = """
+{greeting} Here's your budget analysis:
+
+💰 **Income & Spending Overview**
+• Monthly Income: ${total_income:,.2f}
+• Total Expenses: ${total_expenses:,.2f}
+• Monthly Savings: ${savings:,.2f}
+• Savings Rate: {savings_rate:.1f}%
+
+📊 **Budget Breakdown**
+• Needs (Housing, Food, Transport): ${needs_spending:,.2f}
+• Wants (Entertainment, Shopping): ${wants_spending:,.2f}
+• Recommended Savings Target: ${recommended_savings:,.2f} (20% of income)
+
+🎯 **Budget Health: {health_title}**
+"""
+
+_HEALTH_SUFFIX = {
+    BudgetHealth.EXCELLENT: "\n🌟 Outstanding work! You're exceeding savings goals.",
+    BudgetHealth.NEEDS_IMPROVEMENT: "\n⚠️  Let's work on boosting that savings rate. Small changes can make a big difference!"
+}
+
+_TAX_TMPL = """
+📋 **Tax Estimate for ${income:,.0f} Annual Income**
+
+• Estimated Federal Tax: ${total_tax:,.2f}
+• Effective Tax Rate: {effective_rate:.1f}%
+• After-Tax Income: ${after_tax_income:,.2f}
+
+💡 **Tax Planning Tips:**
+"""
+
+_TAX_TIPS = {
+    'student': """
+• Claim education credits (American Opportunity Credit up to $2,500)
+• Keep receipts for textbooks and school supplies
+• Consider a part-time job for work-study benefits
+""",
+    'professional': """
+• Maximize 401(k) contributions to reduce taxable income
+• Consider HSA contributions if available
+• Track business expenses if self-employed
+• Review tax-loss harvesting for investments
+"""
+}
+
+_SAVINGS_TMPL = """
+🏦 **Savings Strategy**
+
+**Emergency Fund Goal:** ${emergency_fund_target:,.0f}
+(6 months of expenses)
+
+**Recommended Savings Accounts:**
+• High-Yield Savings: 4-5% APY
+• Money Market Account: 3-4% APY
+• CDs: 4-5% APY (if you won't need the money soon)
+
+"""
+
+_SAVINGS_TIPS = {
+    'student': """
+**Student-Specific Tips:**
+• Start with $1,000 emergency fund
+• Use cashback credit cards responsibly
+• Take advantage of student discounts
+• Consider part-time work or internships
+""",
+    'professional': """
+**Professional Tips:**
+• Automate savings transfers
+• Save tax refunds and bonuses
+• Consider employer 401(k) match as "free money"
+• Set up separate accounts for different goals
+"""
+}
+
+_PROFILE_TMPL = """
+👤 **Profile Summary**
+• User Type: {user_type_title}
+• Age: {age}
+• Income: {income_str}
+• Risk Tolerance: {risk_title}
+{expenses_str}"""
+
+_USER_TYPE_CODES = {'student': 0, 'professional': 1}
+
+# Investment suggestion templates keyed by (user_type, risk_tolerance);
+# '*' matches any risk level. Each entry is (type, allocation fraction,
+# reason, risk_level, expected_return), where a None fraction means
+# "up to $5,000". Only the allocation depends on the available funds, so
+# everything else is built once here instead of per call.
+_SUGGESTION_TEMPLATES = {
+    ('student', '*'): (
+        ('High-Yield Savings Account', None,
+         'Build emergency fund with easy access', 'Very Low', '4-5% APY'),
+        ('Index Fund (S&P 500)', 0.7,
+         'Long-term growth with diversification', 'Moderate', '8-10% annually')
+    ),
+    ('professional', 'low'): (
+        ('Bond Index Fund', 0.4,
+         'Stable income with lower volatility', 'Low', '3-5% annually'),
+        ('Dividend Growth Fund', 0.6,
+         'Regular income with growth potential', 'Moderate', '6-8% annually')
+    ),
+    ('professional', 'high'): (
+        ('Growth Stock Index', 0.7,
+         'Higher growth potential for long-term wealth building', 'High', '10-12% annually'),
+        ('International Fund', 0.3,
+         'Geographic diversification', 'Moderate-High', '8-10% annually')
+    )
+}
+
+# Tone configuration is constant; a read-only module-level mapping means
+# no per-instance dict is built and it can't drift at runtime.
+_TONE_STYLES = MappingProxyType({
+    'student': {
+        'greeting': "Hey there! 👋",
+        'complexity': 'simple',
+        'examples': 'relatable_student',
+        'encouragement': 'motivational'
+    },
+    'professional': {
+        'greeting': "Good day,",
+        'complexity': 'detailed',
+        'examples': 'career_focused',
+        'encouragement': 'strategic'
+    }
+})
+
+_GENERAL_ADVICE = {
+    'student': """
+🎓 **General Financial Tips for Students:**
+
+• Create a simple budget with your income (jobs, financial aid)
+• Build credit responsibly with a student credit card
+• Take advantage of student discounts everywhere
+• Start an emergency fund, even if it's just $20/month
+• Learn about investing early - time is your biggest advantage
+• Avoid unnecessary debt beyond student loans
+""",
+    'professional': """
+💼 **General Financial Tips for Professionals:**
+
+• Follow the 50/30/20 rule (needs/wants/savings)
+• Maximize employer 401(k) match
+• Build 3-6 months emergency fund
+• Diversify investments across asset classes
+• Review and optimize insurance coverage
+• Plan for major life events (house, family, retirement)
+• Consider tax-advantaged accounts (HSA, IRA)
+"""
+}
+
+@dataclass(slots=True)
 class UserProfile:
     """User profile to store demographic and financial information"""
     user_type: str  # 'student' or 'professional'
@@ -18,16 +262,51 @@ class UserProfile:
     expenses: Dict[str, float] = None
     financial_goals: List[str] = None
     risk_tolerance: str = 'moderate'  # 'low', 'moderate', 'high'
-    
+    # Bumped whenever expenses change so cached responses built from this
+    # profile can detect staleness.
+    _version: int = field(default=0, init=False, repr=False)
+    _response_cache: Dict = field(default_factory=dict, init=False, repr=False)
+    _total_expenses_cache: Optional[float] = field(default=None, init=False, repr=False)
+
     def __post_init__(self):
         if self.expenses is None:
             self.expenses = {}
         if self.financial_goals is None:
             self.financial_goals = []
 
+    @property
+    def total_expenses(self) -> float:
+        """Sum of all expense categories, cached until expenses change"""
+        if self._total_expenses_cache is None:
+            self._total_expenses_cache = sum(self.expenses.values())
+        return self._total_expenses_cache
+
+
+def profile_to_dict(profile: UserProfile) -> Dict:
+    """Flat dict of a profile's public fields, ready for JSON encoding.
+
+    Built by hand rather than with dataclasses.asdict, which recursively
+    deep-copies every field and would also drag the private cache fields
+    along. The result feeds straight into json.dumps — or orjson/msgspec
+    once a persistence layer lands.
+    """
+    return {
+        'user_type': profile.user_type,
+        'age': profile.age,
+        'income': profile.income,
+        'expenses': profile.expenses,
+        'financial_goals': profile.financial_goals,
+        'risk_tolerance': profile.risk_tolerance
+    }
+
 class FinancialAnalyzer:
     """Core financial analysis and recommendation engine"""
-    
+
+    __slots__ = ('tax_brackets_2024', '_bracket_arrays')
+
+    _NEEDS_SET = frozenset({'rent', 'utilities', 'groceries', 'transportation', 'insurance', 'minimum_debt_payments'})
+    _WANTS_SET = frozenset({'dining_out', 'entertainment', 'shopping', 'hobbies', 'subscriptions'})
+
     def __init__(self):
         self.tax_brackets_2024 = {
             'single': [
@@ -40,29 +319,37 @@ class FinancialAnalyzer:
                 (578125, float('inf'), 0.37)
             ]
         }
-    
+        # Structure-of-arrays view of the brackets so the tax math can run as
+        # one vectorized NumPy expression instead of a Python loop per call.
+        # Infinity is replaced with a large finite sentinel to keep the
+        # arithmetic well-defined.
+        self._bracket_arrays = {}
+        for status, brackets in self.tax_brackets_2024.items():
+            self._bracket_arrays[status] = (
+                np.array([b[0] for b in brackets], dtype=np.float64),
+                np.array([b[1] if b[1] != float('inf') else 1e18 for b in brackets], dtype=np.float64),
+                np.array([b[2] for b in brackets], dtype=np.float64)
+            )
+
     def calculate_tax_estimate(self, income: float, filing_status: str = 'single') -> Dict:
         """Calculate estimated federal taxes"""
         brackets = self.tax_brackets_2024.get(filing_status, self.tax_brackets_2024['single'])
-        total_tax = 0
+        lowers, uppers, rates = self._bracket_arrays.get(filing_status, self._bracket_arrays['single'])
+
+        total_tax = float(_tax_kernel(income, lowers, uppers, rates))
+        taxable = np.clip(np.minimum(income, uppers) - lowers, 0, None)
+        tax_per_bracket = taxable * rates
+
         tax_breakdown = []
-        
-        for i, (lower, upper, rate) in enumerate(brackets):
-            if income <= lower:
-                break
-            
-            taxable_in_bracket = min(income, upper) - lower
-            tax_in_bracket = taxable_in_bracket * rate
-            total_tax += tax_in_bracket
-            
-            if taxable_in_bracket > 0:
-                tax_breakdown.append({
-                    'bracket': f"{rate*100}%",
-                    'range': f"${lower:,.0f} - ${upper:,.0f}" if upper != float('inf') else f"${lower:,.0f}+",
-                    'taxable_amount': taxable_in_bracket,
-                    'tax_amount': tax_in_bracket
-                })
-        
+        for i in np.nonzero(taxable > 0)[0]:
+            lower, upper, rate = brackets[i]
+            tax_breakdown.append({
+                'bracket': f"{rate*100}%",
+                'range': f"${lower:,.0f} - ${upper:,.0f}" if upper != float('inf') else f"${lower:,.0f}+",
+                'taxable_amount': float(taxable[i]),
+                'tax_amount': float(tax_per_bracket[i])
+            })
+
         return {
             'total_tax': total_tax,
             'effective_rate': (total_tax / income) * 100 if income > 0 else 0,
@@ -70,6 +357,16 @@ class FinancialAnalyzer:
             'breakdown': tax_breakdown
         }
     
+    def calculate_tax_estimate_batch(self, incomes, filing_status: str = 'single') -> np.ndarray:
+        """Calculate total federal tax for an array of candidate incomes.
+
+        Useful for income sweeps (e.g. tax-planning sliders) where only the
+        totals are needed; the breakdown of calculate_tax_estimate is skipped.
+        """
+        lowers, uppers, rates = self._bracket_arrays.get(filing_status, self._bracket_arrays['single'])
+        incomes = np.ascontiguousarray(incomes, dtype=np.float64)
+        return _tax_kernel_batch(incomes, lowers, uppers, rates)
+
     def analyze_budget(self, income: float, expenses: Dict[str, float]) -> Dict:
         """Analyze budget and provide insights"""
         total_expenses = sum(expenses.values())
@@ -83,12 +380,10 @@ class FinancialAnalyzer:
             'savings': income * 0.20
         }
         
-        # Categorize expenses
-        needs_categories = ['rent', 'utilities', 'groceries', 'transportation', 'insurance', 'minimum_debt_payments']
-        wants_categories = ['dining_out', 'entertainment', 'shopping', 'hobbies', 'subscriptions']
-        
-        needs_total = sum(expenses.get(cat, 0) for cat in needs_categories)
-        wants_total = sum(expenses.get(cat, 0) for cat in wants_categories)
+        # Categorize expenses: intersect the user's categories with each
+        # bucket so only categories that actually exist are summed.
+        needs_total = sum(expenses[cat] for cat in expenses.keys() & self._NEEDS_SET)
+        wants_total = sum(expenses[cat] for cat in expenses.keys() & self._WANTS_SET)
         
         return {
             'total_income': income,
@@ -101,133 +396,78 @@ class FinancialAnalyzer:
             'budget_health': self._assess_budget_health(savings_rate, needs_total, wants_total, income)
         }
     
-    def _assess_budget_health(self, savings_rate: float, needs: float, wants: float, income: float) -> str:
+    def _assess_budget_health(self, savings_rate: float, needs: float, wants: float, income: float) -> BudgetHealth:
         """Assess overall budget health"""
-        if savings_rate >= 20:
-            return "excellent"
-        elif savings_rate >= 10:
-            return "good"
-        elif savings_rate >= 5:
-            return "fair"
-        else:
-            return "needs_improvement"
+        return _HEALTH_LABELS[bisect.bisect_right(_HEALTH_THRESH, savings_rate)]
     
     def generate_investment_suggestions(self, user_profile: UserProfile, available_funds: float) -> List[Dict]:
         """Generate investment suggestions based on user profile"""
-        suggestions = []
-        
-        if user_profile.user_type == 'student':
-            suggestions.extend([
-                {
-                    'type': 'High-Yield Savings Account',
-                    'allocation': min(available_funds, 5000),
-                    'reason': 'Build emergency fund with easy access',
-                    'risk_level': 'Very Low',
-                    'expected_return': '4-5% APY'
-                },
-                {
-                    'type': 'Index Fund (S&P 500)',
-                    'allocation': available_funds * 0.7,
-                    'reason': 'Long-term growth with diversification',
-                    'risk_level': 'Moderate',
-                    'expected_return': '8-10% annually'
-                }
-            ])
-        else:  # professional
-            if user_profile.risk_tolerance == 'low':
-                suggestions.extend([
-                    {
-                        'type': 'Bond Index Fund',
-                        'allocation': available_funds * 0.4,
-                        'reason': 'Stable income with lower volatility',
-                        'risk_level': 'Low',
-                        'expected_return': '3-5% annually'
-                    },
-                    {
-                        'type': 'Dividend Growth Fund',
-                        'allocation': available_funds * 0.6,
-                        'reason': 'Regular income with growth potential',
-                        'risk_level': 'Moderate',
-                        'expected_return': '6-8% annually'
-                    }
-                ])
-            elif user_profile.risk_tolerance == 'high':
-                suggestions.extend([
-                    {
-                        'type': 'Growth Stock Index',
-                        'allocation': available_funds * 0.7,
-                        'reason': 'Higher growth potential for long-term wealth building',
-                        'risk_level': 'High',
-                        'expected_return': '10-12% annually'
-                    },
-                    {
-                        'type': 'International Fund',
-                        'allocation': available_funds * 0.3,
-                        'reason': 'Geographic diversification',
-                        'risk_level': 'Moderate-High',
-                        'expected_return': '8-10% annually'
-                    }
-                ])
-        
-        return suggestions
+        templates = (_SUGGESTION_TEMPLATES.get((user_profile.user_type, user_profile.risk_tolerance))
+                     or _SUGGESTION_TEMPLATES.get((user_profile.user_type, '*'), ()))
+
+        return [
+            {
+                'type': type_,
+                'allocation': min(available_funds, 5000) if fraction is None else available_funds * fraction,
+                'reason': reason,
+                'risk_level': risk_level,
+                'expected_return': expected_return
+            }
+            for type_, fraction, reason, risk_level, expected_return in templates
+        ]
 
 class ResponseGenerator:
     """Generate contextual responses based on user type and query"""
-    
-    def __init__(self):
-        self.tone_styles = {
-            'student': {
-                'greeting': "Hey there! 👋",
-                'complexity': 'simple',
-                'examples': 'relatable_student',
-                'encouragement': 'motivational'
-            },
-            'professional': {
-                'greeting': "Good day,",
-                'complexity': 'detailed',
-                'examples': 'career_focused',
-                'encouragement': 'strategic'
-            }
-        }
+
+    __slots__ = ()
+
+    # Shared read-only configuration; no per-instance state at all.
+    tone_styles = _TONE_STYLES
+
+    # One compiled alternation covering every student-tone rewrite, so a
+    # single scan replaces two str.replace passes plus a per-call re.sub.
+    _STUDENT_SUBS = re.compile(r'You should|It is recommended|\$(\d+)')
+    _STUDENT_MAP = {
+        'You should': 'You might want to',
+        'It is recommended': "It's a good idea to"
+    }
+
+    @classmethod
+    def _student_sub(cls, match):
+        amount = match.group(1)
+        if amount is not None:
+            return f"${amount} (that's like {amount} cups of coffee! ☕)"
+        return cls._STUDENT_MAP[match.group(0)]
     
     def adapt_tone(self, message: str, user_type: str) -> str:
         """Adapt message tone based on user type"""
-        style = self.tone_styles.get(user_type, self.tone_styles['professional'])
-        
-        if user_type == 'student':
-            # Make it more casual and encouraging
-            message = message.replace("You should", "You might want to")
-            message = message.replace("It is recommended", "It's a good idea to")
-            message = re.sub(r'\$(\d+)', r'$\1 (that\'s like \1 cups of coffee! ☕)', message)
-        
-        return message
+        if user_type != 'student':
+            # Only the student tone has rewrites configured; everything
+            # else passes through untouched.
+            return message
+
+        # Cheap C-level substring checks before the regex scan: most
+        # messages without a dollar amount or a stiff phrase need no
+        # rewriting at all.
+        if '$' not in message and 'You should' not in message and 'It is recommended' not in message:
+            return message
+
+        # Make it more casual and encouraging
+        return self._STUDENT_SUBS.sub(self._student_sub, message)
     
     def generate_budget_summary(self, analysis: Dict, user_profile: UserProfile) -> str:
         """Generate a comprehensive budget summary"""
         user_type = user_profile.user_type
-        
-        summary = f"""
-{self.tone_styles[user_type]['greeting']} Here's your budget analysis:
+        health = analysis['budget_health']
 
-💰 **Income & Spending Overview**
-• Monthly Income: ${analysis['total_income']:,.2f}
-• Total Expenses: ${analysis['total_expenses']:,.2f}
-• Monthly Savings: ${analysis['savings']:,.2f}
-• Savings Rate: {analysis['savings_rate']:.1f}%
-
-📊 **Budget Breakdown**
-• Needs (Housing, Food, Transport): ${analysis['needs_spending']:,.2f}
-• Wants (Entertainment, Shopping): ${analysis['wants_spending']:,.2f}
-• Recommended Savings Target: ${analysis['recommended']['savings']:,.2f} (20% of income)
+        summary = _BUDGET_TMPL.format_map({
+            **analysis,
+            'greeting': self.tone_styles[user_type]['greeting'],
+            'recommended_savings': analysis['recommended']['savings'],
+            'health_title': health.name.replace('_', ' ').title()
+        })
+        summary += _HEALTH_SUFFIX.get(health, '')
 
-🎯 **Budget Health: {analysis['budget_health'].replace('_', ' ').title()}**
-"""
-        
-        if analysis['budget_health'] == 'excellent':
-            summary += "\n🌟 Outstanding work! You're exceeding savings goals."
-        elif analysis['budget_health'] == 'needs_improvement':
-            summary += "\n⚠️  Let's work on boosting that savings rate. Small changes can make a big difference!"
-        
         return self.adapt_tone(summary, user_type)
     
     def generate_spending_insights(self, expenses: Dict[str, float], user_profile: UserProfile) -> List[str]:
@@ -235,11 +475,10 @@ class ResponseGenerator:
         insights = []
         total_expenses = sum(expenses.values())
         
-        # Find highest expense categories
-        sorted_expenses = sorted(expenses.items(), key=lambda x: x[1], reverse=True)
-        
-        if len(sorted_expenses) > 0:
-            highest_category, highest_amount = sorted_expenses[0]
+        # Find the highest expense category: a single O(n) max instead of
+        # sorting the whole dict just to read the first entry
+        if expenses:
+            highest_category, highest_amount = max(expenses.items(), key=operator.itemgetter(1))
             percentage = (highest_amount / total_expenses) * 100
             
             insights.append(f"Your highest expense is {highest_category}: ${highest_amount:,.2f} ({percentage:.1f}% of total spending)")
@@ -259,16 +498,44 @@ class ResponseGenerator:
         if 'subscriptions' in expenses and expenses['subscriptions'] > 50:
             insights.append("🔍 Review subscriptions - you might have services you're not using regularly.")
         
-        return [self.adapt_tone(insight, user_profile.user_type) for insight in insights]
+        if user_profile.user_type != 'student':
+            return insights
+        return [self.adapt_tone(insight, 'student') for insight in insights]
 
 class PersonalFinanceChatbot:
     """Main chatbot class orchestrating all components"""
-    
+
+    # Single compiled alternation covering every intent keyword; one scan
+    # over the query replaces the per-keyword substring checks, and the
+    # matched group name selects the handler.
+    _INTENT_RE = re.compile(
+        r'(?P<tax>tax|federal)'
+        r'|(?P<budget>budget|spending|expenses)'
+        r'|(?P<invest>invest|portfolio)'
+        r'|(?P<save>save|savings|emergency fund)',
+        re.IGNORECASE
+    )
+
     def __init__(self):
         self.analyzer = FinancialAnalyzer()
         self.response_generator = ResponseGenerator()
         self.user_profiles = {}  # In production, this would be a database
-        self.conversation_history = {}
+        # Ring buffer per user: appends are O(1) and old turns are
+        # evicted automatically, so history memory stays bounded.
+        self.conversation_history = defaultdict(lambda: deque(maxlen=50))
+        # Hot profile fields mirrored as parallel NumPy columns so bulk
+        # analytics over many users run as array reductions instead of
+        # Python loops over UserProfile objects.
+        self._profile_rows = {}  # user_id -> row index into the columns
+        self._income_col = np.zeros(0, dtype=np.float64)
+        self._age_col = np.zeros(0, dtype=np.int32)
+        self._user_type_col = np.zeros(0, dtype=np.int8)
+        self._intent_dispatch = {
+            'tax': self._handle_tax_query,
+            'budget': self._handle_budget_query,
+            'invest': self._handle_investment_query,
+            'save': self._handle_savings_query
+        }
     
     def create_user_profile(self, user_id: str, user_type: str, age: int, **kwargs) -> UserProfile:
         """Create and store user profile"""
@@ -278,12 +545,34 @@ class PersonalFinanceChatbot:
             **kwargs
         )
         self.user_profiles[user_id] = profile
+
+        row = self._profile_rows.get(user_id)
+        if row is None:
+            row = len(self._profile_rows)
+            self._profile_rows[user_id] = row
+            self._income_col = np.append(self._income_col, 0.0)
+            self._age_col = np.append(self._age_col, 0)
+            self._user_type_col = np.append(self._user_type_col, 0)
+        self._income_col[row] = profile.income or 0.0
+        self._age_col[row] = profile.age
+        self._user_type_col[row] = _USER_TYPE_CODES.get(profile.user_type, -1)
+
         return profile
+
+    def average_income(self, user_type: Optional[str] = None) -> float:
+        """Average income across stored profiles, optionally for one user type"""
+        incomes = self._income_col
+        if user_type is not None:
+            incomes = incomes[self._user_type_col == _USER_TYPE_CODES.get(user_type, -1)]
+        return float(incomes.mean()) if incomes.size else 0.0
     
     def update_user_expenses(self, user_id: str, expenses: Dict[str, float]):
         """Update user expense data"""
         if user_id in self.user_profiles:
-            self.user_profiles[user_id].expenses.update(expenses)
+            profile = self.user_profiles[user_id]
+            profile.expenses.update(expenses)
+            profile._version += 1
+            profile._total_expenses_cache = None
     
     def process_query(self, user_id: str, query: str) -> str:
         """Process user query and generate response"""
@@ -291,24 +580,17 @@ class PersonalFinanceChatbot:
             return "Please create your profile first using create_profile()."
         
         user_profile = self.user_profiles[user_id]
-        query_lower = query.lower()
-        
+
         try:
-            if any(word in query_lower for word in ['tax', 'taxes', 'federal']):
-                return self._handle_tax_query(user_profile, query)
-            
-            elif any(word in query_lower for word in ['budget', 'spending', 'expenses']):
-                return self._handle_budget_query(user_profile, query)
-            
-            elif any(word in query_lower for word in ['invest', 'investment', 'portfolio']):
-                return self._handle_investment_query(user_profile, query)
-            
-            elif any(word in query_lower for word in ['save', 'savings', 'emergency fund']):
-                return self._handle_savings_query(user_profile, query)
-            
-            else:
-                return self._handle_general_query(user_profile, query)
-        
+            match = self._INTENT_RE.search(query)
+            handler = self._intent_dispatch.get(
+                match.lastgroup if match else None,
+                self._handle_general_query
+            )
+            response = handler(user_profile, query)
+            self.conversation_history[user_id].append((query, response))
+            return response
+
         except Exception as e:
             logger.error(f"Error processing query: {e}")
             return "I'm sorry, I encountered an error processing your request. Please try again."
@@ -317,40 +599,30 @@ class PersonalFinanceChatbot:
         """Handle tax-related queries"""
         if not user_profile.income:
             return "I need your income information to calculate taxes. Please update your profile with your annual income."
-        
+
+        cached = user_profile._response_cache.get('tax')
+        if cached is not None and cached[0] == user_profile.income:
+            return cached[1]
+
         tax_analysis = self.analyzer.calculate_tax_estimate(user_profile.income)
-        
-        response = f"""
-📋 **Tax Estimate for ${user_profile.income:,.0f} Annual Income**
 
-• Estimated Federal Tax: ${tax_analysis['total_tax']:,.2f}
-• Effective Tax Rate: {tax_analysis['effective_rate']:.1f}%
-• After-Tax Income: ${tax_analysis['after_tax_income']:,.2f}
+        response = _TAX_TMPL.format_map({**tax_analysis, 'income': user_profile.income})
+        response += _TAX_TIPS.get(user_profile.user_type, _TAX_TIPS['professional'])
 
-💡 **Tax Planning Tips:**
-"""
-        
-        if user_profile.user_type == 'student':
-            response += """
-• Claim education credits (American Opportunity Credit up to $2,500)
-• Keep receipts for textbooks and school supplies
-• Consider a part-time job for work-study benefits
-"""
-        else:
-            response += """
-• Maximize 401(k) contributions to reduce taxable income
-• Consider HSA contributions if available
-• Track business expenses if self-employed
-• Review tax-loss harvesting for investments
-"""
-        
-        return self.response_generator.adapt_tone(response, user_profile.user_type)
+        response = self.response_generator.adapt_tone(response, user_profile.user_type)
+        user_profile._response_cache['tax'] = (user_profile.income, response)
+        return response
     
     def _handle_budget_query(self, user_profile: UserProfile, query: str) -> str:
         """Handle budget-related queries"""
         if not user_profile.income or not user_profile.expenses:
             return "I need your income and expense information to analyze your budget. Please update your profile."
-        
+
+        cache_key = (user_profile._version, user_profile.income)
+        cached = user_profile._response_cache.get('budget')
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
         budget_analysis = self.analyzer.analyze_budget(user_profile.income, user_profile.expenses)
         budget_summary = self.response_generator.generate_budget_summary(budget_analysis, user_profile)
         spending_insights = self.response_generator.generate_spending_insights(user_profile.expenses, user_profile)
@@ -358,7 +630,8 @@ class PersonalFinanceChatbot:
         response = budget_summary + "\n\n🔍 **Spending Insights:**\n"
         for insight in spending_insights[:3]:  # Limit to top 3 insights
             response += f"• {insight}\n"
-        
+
+        user_profile._response_cache['budget'] = (cache_key, response)
         return response
     
     def _handle_investment_query(self, user_profile: UserProfile, query: str) -> str:
@@ -367,7 +640,7 @@ class PersonalFinanceChatbot:
             return "I need your income information to provide investment advice. Please update your profile."
         
         # Calculate available funds for investment (assuming 20% of income after expenses)
-        total_expenses = sum(user_profile.expenses.values()) if user_profile.expenses else user_profile.income * 0.8
+        total_expenses = user_profile.total_expenses if user_profile.expenses else user_profile.income * 0.8
         available_funds = max(0, (user_profile.income - total_expenses) * 0.8)  # 80% of savings for investments
         
         if available_funds < 100:
@@ -396,67 +669,91 @@ class PersonalFinanceChatbot:
     
     def _handle_savings_query(self, user_profile: UserProfile, query: str) -> str:
         """Handle savings-related queries"""
-        emergency_fund_target = (sum(user_profile.expenses.values()) if user_profile.expenses else user_profile.income * 0.7) * 6
-        
-        response = f"""
-🏦 **Savings Strategy**
+        cache_key = (user_profile._version, user_profile.income)
+        cached = user_profile._response_cache.get('savings')
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
 
-**Emergency Fund Goal:** ${emergency_fund_target:,.0f}
-(6 months of expenses)
+        emergency_fund_target = (user_profile.total_expenses if user_profile.expenses else user_profile.income * 0.7) * 6
 
-**Recommended Savings Accounts:**
-• High-Yield Savings: 4-5% APY
-• Money Market Account: 3-4% APY
-• CDs: 4-5% APY (if you won't need the money soon)
+        response = _SAVINGS_TMPL.format_map({'emergency_fund_target': emergency_fund_target})
+        response += _SAVINGS_TIPS.get(user_profile.user_type, _SAVINGS_TIPS['professional'])
 
-"""
-        
-        if user_profile.user_type == 'student':
-            response += """
-**Student-Specific Tips:**
-• Start with $1,000 emergency fund
-• Use cashback credit cards responsibly
-• Take advantage of student discounts
-• Consider part-time work or internships
-"""
-        else:
-            response += """
-**Professional Tips:**
-• Automate savings transfers
-• Save tax refunds and bonuses
-• Consider employer 401(k) match as "free money"
-• Set up separate accounts for different goals
-"""
-        
-        return self.response_generator.adapt_tone(response, user_profile.user_type)
+        response = self.response_generator.adapt_tone(response, user_profile.user_type)
+        user_profile._response_cache['savings'] = (cache_key, response)
+        return response
     
-    def _handle_general_query(self, user_profile: UserProfile, query: str) -> str:
-        """Handle general financial queries"""
-        general_advice = {
-            'student': """
-🎓 **General Financial Tips for Students:**
+    def _compute_all(self, user_profile: UserProfile) -> Dict:
+        """Compute every headline metric for a profile in one fused pass.
 
-• Create a simple budget with your income (jobs, financial aid)
-• Build credit responsibly with a student credit card
-• Take advantage of student discounts everywhere
-• Start an emergency fund, even if it's just $20/month
-• Learn about investing early - time is your biggest advantage
-• Avoid unnecessary debt beyond student loans
-""",
-            'professional': """
-💼 **General Financial Tips for Professionals:**
+        Sums the expenses once and shares the result (plus the tax kernel
+        output) across the tax, budget, investment, and savings panels,
+        instead of letting each handler re-derive it.
+        """
+        income = user_profile.income or 0.0
+        expenses = user_profile.expenses
+        total_expenses = user_profile.total_expenses
+        savings = income - total_expenses
+        savings_rate = (savings / income) * 100 if income > 0 else 0
+        needs_total = sum(expenses[cat] for cat in expenses.keys() & FinancialAnalyzer._NEEDS_SET)
+        wants_total = sum(expenses[cat] for cat in expenses.keys() & FinancialAnalyzer._WANTS_SET)
+        total_tax = float(_tax_kernel(income, *self.analyzer._bracket_arrays['single']))
 
-• Follow the 50/30/20 rule (needs/wants/savings)
-• Maximize employer 401(k) match
-• Build 3-6 months emergency fund
-• Diversify investments across asset classes
-• Review and optimize insurance coverage
-• Plan for major life events (house, family, retirement)
-• Consider tax-advantaged accounts (HSA, IRA)
-"""
+        return {
+            'income': income,
+            'total_income': income,
+            'total_expenses': total_expenses,
+            'total_tax': total_tax,
+            'effective_rate': (total_tax / income) * 100 if income > 0 else 0,
+            'after_tax_income': income - total_tax,
+            'savings': savings,
+            'savings_rate': savings_rate,
+            'needs_spending': needs_total,
+            'wants_spending': wants_total,
+            'recommended_savings': income * 0.20,
+            'budget_health': self.analyzer._assess_budget_health(savings_rate, needs_total, wants_total, income),
+            'emergency_fund_target': total_expenses * 6,
+            'available_funds': max(0, savings * 0.8)
         }
-        
-        response = general_advice.get(user_profile.user_type, general_advice['professional'])
+
+    def get_financial_dashboard(self, user_id: str) -> str:
+        """Render the tax, budget, investment, and savings panels at once"""
+        if user_id not in self.user_profiles:
+            return "Please create your profile first using create_profile()."
+
+        user_profile = self.user_profiles[user_id]
+        if not user_profile.income or not user_profile.expenses:
+            return "I need your income and expense information for a full dashboard. Please update your profile."
+
+        metrics = self._compute_all(user_profile)
+        user_type = user_profile.user_type
+        health = metrics['budget_health']
+
+        response = _TAX_TMPL.format_map(metrics)
+        response += _TAX_TIPS.get(user_type, _TAX_TIPS['professional'])
+        response += _BUDGET_TMPL.format_map({
+            **metrics,
+            'greeting': self.response_generator.tone_styles[user_type]['greeting'],
+            'health_title': health.name.replace('_', ' ').title()
+        })
+        response += _HEALTH_SUFFIX.get(health, '')
+        response += _SAVINGS_TMPL.format_map(metrics)
+        response += _SAVINGS_TIPS.get(user_type, _SAVINGS_TIPS['professional'])
+
+        for suggestion in self.analyzer.generate_investment_suggestions(user_profile, metrics['available_funds']):
+            response += f"""
+**{suggestion['type']}**
+• Suggested Amount: ${suggestion['allocation']:,.0f}
+• Risk Level: {suggestion['risk_level']}
+• Expected Return: {suggestion['expected_return']}
+• Why: {suggestion['reason']}
+"""
+
+        return self.response_generator.adapt_tone(response, user_type)
+
+    def _handle_general_query(self, user_profile: UserProfile, query: str) -> str:
+        """Handle general financial queries"""
+        response = _GENERAL_ADVICE.get(user_profile.user_type, _GENERAL_ADVICE['professional'])
         return self.response_generator.adapt_tone(response, user_profile.user_type)
     
     def get_user_profile_summary(self, user_id: str) -> str:
@@ -465,18 +762,13 @@ class PersonalFinanceChatbot:
             return "No profile found."
         
         profile = self.user_profiles[user_id]
-        summary = f"""
-👤 **Profile Summary**
-• User Type: {profile.user_type.title()}
-• Age: {profile.age}
-• Income: ${profile.income:,.2f}/year" if profile.income else "Not set"
-• Risk Tolerance: {profile.risk_tolerance.title()}
-"""
-        
-        if profile.expenses:
-            summary += f"• Monthly Expenses: ${sum(profile.expenses.values()):,.2f}"
-        
-        return summary
+        return _PROFILE_TMPL.format_map({
+            'user_type_title': profile.user_type.title(),
+            'age': profile.age,
+            'income_str': f"${profile.income:,.2f}/year" if profile.income else "Not set",
+            'risk_title': profile.risk_tolerance.title(),
+            'expenses_str': f"• Monthly Expenses: ${profile.total_expenses:,.2f}" if profile.expenses else ""
+        })
 
 # Example usage and testing
 def main():